@@ -157,11 +157,13 @@ def GRAD(u):
 # Undeformed configuration: curvature
 κ0 = -B0i[0, 0]  # from curvature tensor B0i
 
+# Deformed configuration: tangent components (at the principal axis) and rotation, shared subexpressions
+ts = 1.0 + GRAD(x0[0]) * GRAD(u) + GRAD(x0[2]) * GRAD(w)
+tξ = GRAD(x0[2]) * GRAD(u) - GRAD(x0[0]) * GRAD(w)
+cr, sr = ufl.cos(r), ufl.sin(r)
 # Deformed configuration: stretch components (at the principal axis)
-λs = (1.0 + GRAD(x0[0]) * GRAD(u) + GRAD(x0[2]) * GRAD(w)) * ufl.cos(r) + \
-     (GRAD(x0[2]) * GRAD(u) - GRAD(x0[0]) * GRAD(w)) * ufl.sin(r)
-λξ = (1.0 + GRAD(x0[0]) * GRAD(u) + GRAD(x0[2]) * GRAD(w)) * ufl.sin(r) - \
-     (GRAD(x0[2]) * GRAD(u) - GRAD(x0[0]) * GRAD(w)) * ufl.cos(r)
+λs = ts * cr + tξ * sr
+λξ = ts * sr - tξ * cr
 # Deformed configuration: curvature
 κ = GRAD(r)
 
@@ -220,47 +222,74 @@ opts["snes_type"] = "newtonls"
 opts["snes_linesearch_type"] = "basic"
 opts["snes_atol"] = 1.0e-07
 opts["snes_rtol"] = 1.0e-07
-opts["snes_stol"] = 1.0e-06
+opts["snes_stol"] = 0.0  # no step-size test: small chord steps on a lagged tangent do not imply convergence
 opts["snes_max_it"] = 60
+opts["snes_lag_jacobian"] = 5  # re-use tangent (and its factorisation) for 5 iterations within a load step
 opts["ksp_type"] = "preonly"
-opts["pc_type"] = "lu"
+opts["pc_type"] = "cholesky"  # symmetric tangent: MUMPS with SYM = 2
 opts["pc_factor_mat_solver_type"] = "mumps"
 
-# Create nonlinear problem: SNES
-problem = dolfiny.snesblockproblem.SNESBlockProblem(F, m, prefix="beam")
-
 # Identify dofs of function spaces associated with tagged interfaces/boundaries
 beg_dofs_Uf = dolfiny.mesh.locate_dofs_topological(Uf, interfaces, beg)
 beg_dofs_Wf = dolfiny.mesh.locate_dofs_topological(Wf, interfaces, beg)
 beg_dofs_Rf = dolfiny.mesh.locate_dofs_topological(Rf, interfaces, beg)
 
-# Create custom plotter (via matplotlib)
-plotter = pp.Plotter(f"{name}.pdf", r'finite strain beam (1st order shear, displacement-based, on $\mathcal{B}_{*}$)')
+# Set boundary conditions (values are taken from u_, w_, r_ and may be updated in-place)
+bcs = [
+    dolfinx.fem.dirichletbc(u_, beg_dofs_Uf),  # u beg
+    dolfinx.fem.dirichletbc(w_, beg_dofs_Wf),  # w beg
+    dolfinx.fem.dirichletbc(r_, beg_dofs_Rf),  # r beg
+]
+
+# Create nonlinear problem: SNES (tabulate_tensor kernels compiled with aggressive optimisation)
+jit_parameters = {"cffi_extra_compile_args": ["-O3", "-ffast-math", "-funroll-loops"],
+                  "cffi_libraries": ["m"]}
+problem = dolfiny.snesblockproblem.SNESBlockProblem(F, m, bcs=bcs, prefix="beam", jit_parameters=jit_parameters)
+
+# Tangent operator is symmetric (second variation of potential, conservative loads)
+problem.J.setOption(PETSc.Mat.Option.SYMMETRIC, True)
+problem.J.setOption(PETSc.Mat.Option.SYMMETRY_ETERNAL, True)
+
+# Create custom plotter (via matplotlib, only used in serial)
+if comm.size == 1:
+    plotter = pp.Plotter(f"{name}.pdf",
+                         r'finite strain beam (1st order shear, displacement-based, on $\mathcal{B}_{*}$)')
 
 # Create vector function space and vector function for writing the displacement vector
 Z = dolfinx.fem.VectorFunctionSpace(mesh, ("CG", p), mesh.geometry.dim)
 z = dolfinx.fem.Function(Z)
 
-# Process load steps
-for factor in np.linspace(0, 1, num=20 + 1):
+# Process load steps, with load increment adapted to the effort of the nonlinear solver
+factor, dfactor, dfactor_min = 0.0, 0.1, 1.0e-3
+
+# Last converged load factor and state (restart point after a failed load step)
+factor_c, m_c = factor, [mi.x.array.copy() for mi in (u, w, r)]
+
+# Tangent lag, used to count tangent (re)assemblies per load step
+# Note: the adaptation heuristic below assumes a tangent lagged by a few (~5) iterations, lag >= 1 enforced
+lag = max(opts.getInt("snes_lag_jacobian"), 1)
+
+while True:
 
     # Set current time
     μ.value = factor
 
-    # Set/update boundary conditions
-    problem.bcs = [
-        dolfinx.fem.dirichletbc(u_, beg_dofs_Uf),  # u beg
-        dolfinx.fem.dirichletbc(w_, beg_dofs_Wf),  # w beg
-        dolfinx.fem.dirichletbc(r_, beg_dofs_Rf),  # r beg
-    ]
-
     dolfiny.utils.pprint(f"\n+++ Processing load factor μ = {μ.value:5.4f}")
 
-    # Solve nonlinear problem
-    m = problem.solve()
+    # Solve nonlinear problem, starting from the last converged state
+    m = problem.solve(u_init=[u, w, r])
+
+    # On divergence: restore last converged state and retry with halved load increment
+    if problem.snes.getConvergedReason() <= 0:
+        for mi, mi_c in zip((u, w, r), m_c):
+            mi.x.array[:] = mi_c
+        dfactor /= 2
+        assert dfactor >= dfactor_min, "Nonlinear solver did not converge!"
+        factor = min(factor_c + dfactor, 1.0)
+        continue
 
-    # Assert convergence of nonlinear solver
-    assert problem.snes.getConvergedReason() > 0, "Nonlinear solver did not converge!"
+    # Store converged load factor and state
+    factor_c, m_c = factor, [mi.x.array.copy() for mi in (u, w, r)]
 
     # Add to plot
     if comm.size == 1:
@@ -271,4 +300,18 @@ for factor in np.linspace(0, 1, num=20 + 1):
         dolfiny.interpolation.interpolate(ufl.as_vector([u, 0, w]), z)
         ofile.write_function(z, μ.value)
 
+    # Terminate at full load
+    if factor == 1.0:
+        break
+
+    # Adapt load increment to the number of tangents needed: increase if the first one sufficed,
+    # decrease if three or more were needed (iteration counts are inflated by the lagged tangent)
+    tangents = -(-problem.snes.getIterationNumber() // lag)
+    if factor > 0.0 and tangents <= 1:
+        dfactor *= 2
+    elif factor > 0.0 and tangents >= 3:
+        dfactor /= 2
+
+    factor = min(factor + dfactor, 1.0)
+
 ofile.close()
@@ -7,9 +7,11 @@ class Plotter():
 
         self.outfile = outfile
 
-        import matplotlib.pyplot
+        # Figure without pyplot: avoids loading (interactive) backends, output is written via savefig only
+        import matplotlib.figure
 
-        fig, ax1 = matplotlib.pyplot.subplots()
+        fig = matplotlib.figure.Figure()
+        ax1 = fig.subplots()
         ax1.set_title(title, fontsize=12)
         ax1.set_xlabel(r'coordinate $x$, displacement $[m]$', fontsize=12)
         ax1.set_ylabel(r'coordinate $z$, displacement $[m]$', fontsize=12)
@@ -46,8 +48,7 @@ class Plotter():
         # Extract mesh geometry nodal coordinates
         dm = mesh.geometry.dofmap
         oq = [0] + [*range(2, q + 1)] + [1]  # reorder lineX nodes: all ducks in a row...
-        x0_idx = [[dm.links(i).tolist()[k] for k in oq] for i in range(dm.num_nodes)]
-        x0_idx = [item for sublist in x0_idx for item in sublist]
+        x0_idx = dm.array.reshape(dm.num_nodes, -1)[:, oq].ravel()
         x0 = mesh.geometry.x[x0_idx]
 
         # Interpolate solution at mesh geometry nodes
@@ -192,6 +192,13 @@ ring_outer_dofs_V = dolfiny.mesh.locate_dofs_topological(V, interfaces, ring_out
 ring_inner_dofs_V = dolfiny.mesh.locate_dofs_topological(V, interfaces, ring_inner)
 ring_inner_dofs_P = dolfiny.mesh.locate_dofs_topological(P, interfaces, ring_inner)
 
+# Set boundary conditions (values are updated in-place in the time loop)
+problem.bcs = [
+    dolfinx.fem.dirichletbc(v_vector_o, ring_outer_dofs_V),  # velocity ring_outer
+    dolfinx.fem.dirichletbc(v_vector_i, ring_inner_dofs_V),  # velocity ring_inner
+    dolfinx.fem.dirichletbc(p_scalar_i, ring_inner_dofs_P),  # pressure ring_inner
+]
+
 # Process time steps
 for time_step in range(1, nT + 1):
 
@@ -204,13 +211,6 @@ for time_step in range(1, nT + 1):
     v_vector_o.interpolate(v_vector_o_)
     v_vector_i.interpolate(v_vector_i_)
 
-    # Set/update boundary conditions
-    problem.bcs = [
-        dolfinx.fem.dirichletbc(v_vector_o, ring_outer_dofs_V),  # velocity ring_outer
-        dolfinx.fem.dirichletbc(v_vector_i, ring_inner_dofs_V),  # velocity ring_inner
-        dolfinx.fem.dirichletbc(p_scalar_i, ring_inner_dofs_P),  # pressure ring_inner
-    ]
-
     # Solve nonlinear problem
     problem.solve()
 
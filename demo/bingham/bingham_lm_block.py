@@ -201,6 +201,12 @@ problem = dolfiny.snesblockproblem.SNESBlockProblem(F, m, prefix="bingham", rest
 ring_outer_dofs_V = dolfiny.mesh.locate_dofs_topological(V, interfaces, ring_outer)
 ring_inner_dofs_P = dolfiny.mesh.locate_dofs_topological(P, interfaces, ring_outer)
 
+# Set boundary conditions (homogeneous, created once)
+problem.bcs = [
+    dolfinx.fem.dirichletbc(v_vector_o, ring_outer_dofs_V),  # velocity ring_outer
+    dolfinx.fem.dirichletbc(p_scalar_i, ring_inner_dofs_P),  # pressure ring_inner
+]
+
 # Process time steps
 for time_step in range(1, nT + 1):
 
@@ -212,12 +218,6 @@ for time_step in range(1, nT + 1):
     # Update functions (taking up time.value)
     v_t.value = v_inner_(t=time.value)
 
-    # Set/update boundary conditions
-    problem.bcs = [
-        dolfinx.fem.dirichletbc(v_vector_o, ring_outer_dofs_V),  # velocity ring_outer
-        dolfinx.fem.dirichletbc(p_scalar_i, ring_inner_dofs_P),  # pressure ring_inner
-    ]
-
     # Solve nonlinear problem
     problem.solve()
 
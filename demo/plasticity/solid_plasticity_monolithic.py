@@ -192,6 +192,12 @@ load, unload = np.linspace(0.0, 1.0, num=K + 1), np.linspace(1.0, 0.0, num=K + 1
 cycle = np.concatenate((load, unload, -load, -unload))
 cycles = np.concatenate([cycle] * Z)
 
+# Set boundary conditions (values are updated in-place in the load loop)
+problem.bcs = [
+    dolfinx.fem.dirichletbc(u_, surface_1_dofs_Vf),  # disp left
+    dolfinx.fem.dirichletbc(u_, surface_2_dofs_Vf),  # disp right
+]
+
 # Process load steps
 for step, factor in enumerate(cycles):
 
@@ -203,12 +209,6 @@ for step, factor in enumerate(cycles):
     # Update values for given boundary displacement
     u_.interpolate(u_bar)
 
-    # Set/update boundary conditions
-    problem.bcs = [
-        dolfinx.fem.dirichletbc(u_, surface_1_dofs_Vf),  # disp left
-        dolfinx.fem.dirichletbc(u_, surface_2_dofs_Vf),  # disp right
-    ]
-
     # Solve nonlinear problem
     problem.solve()
 
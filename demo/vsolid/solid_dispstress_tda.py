@@ -151,6 +151,11 @@ problem = dolfiny.snesblockproblem.SNESBlockProblem(F, m, prefix=name)
 # Identify dofs of function spaces associated with tagged interfaces/boundaries
 surface_left_dofs_Uf = dolfiny.mesh.locate_dofs_topological(Uf, interfaces, surface_left)
 
+# Set boundary conditions (homogeneous, clamped, created once)
+problem.bcs = [
+    dolfinx.fem.dirichletbc(u_, surface_left_dofs_Uf),  # disp left (clamped)
+]
+
 # Process time steps
 for time_step in range(1, nT + 1):
 
@@ -159,11 +164,6 @@ for time_step in range(1, nT + 1):
     # Stage next time step
     odeint.stage()
 
-    # Set/update boundary conditions
-    problem.bcs = [
-        dolfinx.fem.dirichletbc(u_, surface_left_dofs_Uf),  # disp left (clamped)
-    ]
-
     # Solve nonlinear problem
     problem.solve()
 
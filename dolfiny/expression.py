@@ -73,16 +73,14 @@ def derivative(e, u, du, u0=None):
                 de0_ = sum(ufl.derivative(e0_, v0, dv) for v0, dv in zip(u0, du))
             else:
                 de0_ = ufl.derivative(e0_, u0, du)
-            de0_ = ufl.algorithms.apply_algebra_lowering.apply_algebra_lowering(de0_)
-            de0_ = ufl.algorithms.apply_derivatives.apply_derivatives(de0_)
+            de0_ = ufl.algorithms.expand_derivatives(de0_)
             de0.append(de0_)
     else:
         if isinstance(u0, list) and isinstance(du, list):
             de0 = sum(ufl.derivative(e0, v0, dv) for v0, dv in zip(u0, du))
         else:
             de0 = ufl.derivative(e0, u0, du)
-        de0 = ufl.algorithms.apply_algebra_lowering.apply_algebra_lowering(de0)
-        de0 = ufl.algorithms.apply_derivatives.apply_derivatives(de0)
+        de0 = ufl.algorithms.expand_derivatives(de0)
 
     return de0
 
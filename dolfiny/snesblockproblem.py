@@ -13,7 +13,8 @@ from dolfiny.utils import pprint
 
 class SNESBlockProblem():
     def __init__(self, F_form: typing.List, u: typing.List, bcs=[], J_form=None,
-                 nest=False, restriction=None, prefix=None, localsolver: dolfiny.localsolver.LocalSolver = None):
+                 nest=False, restriction=None, prefix=None, localsolver: dolfiny.localsolver.LocalSolver = None,
+                 jit_parameters=None):
         """SNES problem and solver wrapper
 
         Parameters
@@ -33,6 +34,10 @@ class SNESBlockProblem():
         localsolver: optional
             ``LocalSolver`` class providing context on elimination of local
             degrees-of-freedom.
+        jit_parameters: optional
+            Parameters passed to the JIT compilation of all forms, e.g.
+            ``{"cffi_extra_compile_args": ["-O3", "-ffast-math"]}``.
+            Updates the default parameters.
 
         """
         self.u = u
@@ -63,9 +68,9 @@ class SNESBlockProblem():
             self.J_form = J_form
 
         # Compile all forms
-        jit_parameters = {"timeout": 50}
-        self.F_form_all_ufc = dolfinx.fem.form(F_form, jit_params=jit_parameters)
-        self.J_form_all_ufc = dolfinx.fem.form(J_form, jit_params=jit_parameters)
+        self.jit_parameters = {"timeout": 50, **(jit_parameters or {})}
+        self.F_form_all_ufc = dolfinx.fem.form(F_form, jit_params=self.jit_parameters)
+        self.J_form_all_ufc = dolfinx.fem.form(J_form, jit_params=self.jit_parameters)
 
         # By default, copy all forms as the forms used in assemblers
         self.F_form = self.F_form_all_ufc.copy()
@@ -293,12 +298,15 @@ class SNESBlockProblem():
 
             # Need first apply square, only then sum over processes
             # i.e. norm is not a linear function
-            ei_r.append(np.sqrt(self.comm.allreduce(np.linalg.norm(subvec_r) ** 2, op=MPI.SUM)))
-            ei_dx.append(np.sqrt(self.comm.allreduce(np.linalg.norm(subvec_dx) ** 2, op=MPI.SUM)))
-            ei_x.append(np.sqrt(self.comm.allreduce(np.linalg.norm(subvec_x) ** 2, op=MPI.SUM)))
+            ei_r.append(np.linalg.norm(subvec_r) ** 2)
+            ei_dx.append(np.linalg.norm(subvec_dx) ** 2)
+            ei_x.append(np.linalg.norm(subvec_x) ** 2)
 
             offset += size_local
 
+        # Sum over processes for all norms at once (single collective)
+        ei_r, ei_dx, ei_x = np.sqrt(self.comm.allreduce(np.array([ei_r, ei_dx, ei_x]), op=MPI.SUM)).tolist()
+
         it = snes.getIterationNumber()
         self.norm_r[it] = ei_r
         self.norm_dx[it] = ei_dx
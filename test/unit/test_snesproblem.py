@@ -85,3 +85,23 @@ def test_block(V1, V2, squaremesh_5, nest):
     assert problem.snes.getConvergedReason() > 0
     assert np.isclose((sol[0].vector - np.arcsin(0.5)).norm(), 0.0)
     assert np.isclose((sol[1].vector - 4.0 * np.arcsin(0.5)).norm(), 0.0)
+
+
+def test_jit_parameters(V1, squaremesh_5):
+    u = dolfinx.fem.Function(V1, name="u")
+    v = ufl.TestFunction(V1)
+
+    F = ufl.inner(ufl.sin(u) - 0.5, v) * ufl.dx(squaremesh_5)
+
+    jit_parameters = {"cffi_extra_compile_args": ["-O3", "-ffast-math"]}
+
+    problem_default = dolfiny.snesblockproblem.SNESBlockProblem([F], [u])
+    problem = dolfiny.snesblockproblem.SNESBlockProblem([F], [u], jit_parameters=jit_parameters)
+
+    # Provided parameters update (and do not replace) the defaults
+    assert problem_default.jit_parameters == {"timeout": 50}
+    assert problem.jit_parameters == {"timeout": 50, **jit_parameters}
+
+    # Compile flags enter the module signature: same form compiled into different modules
+    assert problem.F_form_all_ufc[0].ufcx_form != problem_default.F_form_all_ufc[0].ufcx_form
+    assert problem.J_form_all_ufc[0][0].ufcx_form != problem_default.J_form_all_ufc[0][0].ufcx_form